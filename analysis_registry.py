@@ -0,0 +1,84 @@
+# Registry of dataset analyses for question5.
+#
+# An analysis is a function that takes the parsed DataFrame of one dataset and
+# returns a single value. It is registered with the dataset it reads, the
+# columns (and their dtypes) it needs and whether it is CPU- or I/O-bound, so a
+# scheduler can decide where to run it and plan_parse() can work out how to
+# parse each dataset once for all of its analyses:
+#
+#     @register_analysis("covid_new_cases", dataset="covid",
+#                        columns=["new_cases"], dtypes={"new_cases": "float64"},
+#                        kind="cpu", label="Total New COVID Cases", fmt="{:,.0f}")
+#     def covid_new_cases(df):
+#         return df["new_cases"].sum()
+#
+# Analysis functions must be defined at module level so they can be pickled
+# and sent to a process pool. Analyses of the same dataset share one parsed
+# DataFrame, so they must not modify it.
+
+KINDS = ("cpu", "io")
+
+# name -> Analysis, in registration order
+ANALYSES = {}
+
+
+class Analysis:
+
+    def __init__(self, name, dataset, func, columns=(), dtypes=None, kind="cpu", label=None, fmt="{}"):
+        if kind not in KINDS:
+            raise ValueError(f"kind must be one of {KINDS}, got {kind!r}")
+        self.name = name
+        self.dataset = dataset
+        self.func = func
+        # Columns the analysis may read; empty means it needs every column
+        self.columns = tuple(columns)
+        self.dtypes = dict(dtypes or {})
+        self.kind = kind
+        self.label = label or name
+        self.fmt = fmt
+
+    def format(self, result):
+        return f"{self.label}: {self.fmt.format(result)}"
+
+    def __repr__(self):
+        return f"Analysis({self.name!r}, dataset={self.dataset!r}, kind={self.kind!r})"
+
+
+def register_analysis(name, dataset, columns=(), dtypes=None, kind="cpu", label=None, fmt="{}"):
+    # Decorator that adds the function to ANALYSES and returns it unchanged
+    def decorator(func):
+        if name in ANALYSES:
+            raise ValueError(f"Analysis already registered: {name}")
+        ANALYSES[name] = Analysis(name, dataset, func, columns, dtypes, kind, label, fmt)
+        return func
+    return decorator
+
+
+def analyses_for(datasets, names=None):
+    """
+    Registered analyses whose dataset is in `datasets`, optionally limited to
+    the given analysis names.
+    """
+    selected = ANALYSES.values() if names is None else [ANALYSES[n] for n in names]
+    return [a for a in selected if a.dataset in datasets]
+
+
+def plan_parse(analyses):
+    """
+    Combine the column needs of analyses over the same dataset into one parse.
+
+    Returns (columns, dtypes): the union of their columns, or None when any
+    analysis needs every column, and the merged dtypes. Raises ValueError if
+    two analyses ask for different dtypes on the same column.
+    """
+    columns = set()
+    dtypes = {}
+    for analysis in analyses:
+        if not analysis.columns:
+            columns = None
+        elif columns is not None:
+            columns.update(analysis.columns)
+        for column, dtype in analysis.dtypes.items():
+            if dtypes.setdefault(column, dtype) != dtype:
+                raise ValueError(f"Conflicting dtypes for column {column!r}: {dtypes[column]} vs {dtype}")
+    return (None if columns is None else frozenset(columns)), dtypes
@@ -0,0 +1,177 @@
+# Per-stage instrumentation for the question5 engines.
+#
+# A Tracer records spans (download, decode, parse, compute, queue_wait, ...)
+# with the process and thread that ran them. Threads share one Tracer, which
+# appends under a lock. A child process records into its own Tracer and
+# returns tracer.spans() to the parent along with its result; the parent adds
+# them with tracer.merge(). Timestamps come from time.perf_counter_ns(),
+# which is a system-wide monotonic clock, so spans from different processes
+# line up on one timeline.
+#
+# Tracer.tagged(engine=...) stamps every span recorded or merged inside the
+# block, so runs of different engines can be told apart in the summary.
+#
+# The "bytes" attribute means bytes transferred over the network; only spans
+# that carry it (downloads) get a throughput. Stages that merely process data
+# use other size attributes (e.g. "input_size", "chars").
+import asyncio
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+
+def now_us():
+    return time.perf_counter_ns() // 1000
+
+
+def current_task():
+    # The running asyncio task, or None outside an event loop
+    try:
+        return asyncio.current_task()
+    except RuntimeError:
+        return None
+
+
+class Tracer:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._spans = []
+        self._tags = {}
+
+    @contextmanager
+    def tagged(self, **tags):
+        """
+        Add `tags` as attributes to every span recorded or merged inside the
+        block. Meant for sequential runs (e.g. one engine at a time), not for
+        tagging concurrent work differently.
+        """
+        previous = self._tags
+        self._tags = {**previous, **tags}
+        try:
+            yield
+        finally:
+            self._tags = previous
+
+    @contextmanager
+    def span(self, stage, dataset=None, **attrs):
+        """
+        Time the enclosed block as one span.
+
+        Yields the span's attribute dict so the block can attach values that
+        are only known at the end, e.g. attrs["bytes"] = len(payload).
+        If the block raises, the span is recorded with an "error" attribute
+        and the exception propagates.
+        """
+        start = now_us()
+        try:
+            yield attrs
+        except Exception as e:
+            attrs["error"] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            self.record(stage, start, now_us(), dataset, **attrs)
+
+    def record(self, stage, start_us, end_us, dataset=None, **attrs):
+        # Record a span whose start and end were measured by the caller
+        duration = max(end_us - start_us, 0)
+        span = {
+            "stage": stage,
+            "dataset": dataset,
+            "start_us": start_us,
+            "duration_us": duration,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "thread": threading.current_thread().name,
+        }
+        # Spans of concurrent asyncio tasks overlap on the event-loop thread;
+        # give each task its own synthetic tid so trace viewers keep them apart
+        task = current_task()
+        if task is not None:
+            span["tid"] = id(task)
+            span["task"] = task.get_name()
+        span.update(self._tags)
+        span.update(attrs)
+        if "bytes" in span and duration and "error" not in span:
+            span["throughput_bps"] = span["bytes"] / (duration / 1_000_000)
+        with self._lock:
+            self._spans.append(span)
+
+    def spans(self):
+        with self._lock:
+            return list(self._spans)
+
+    def merge(self, spans):
+        # Add spans recorded elsewhere (typically in a child process)
+        spans = [{**self._tags, **span} for span in spans]
+        with self._lock:
+            self._spans.extend(spans)
+
+    def clear(self):
+        with self._lock:
+            self._spans.clear()
+
+    def summary(self, group_by=("engine",)):
+        """
+        Per (group_by tags..., stage): span count, failed spans, summed span
+        time, wall-clock window (first start to last end) and bytes
+        transferred, in first-seen order.
+        """
+        totals = {}
+        for span in self.spans():
+            key = tuple(span.get(tag) for tag in group_by) + (span["stage"],)
+            entry = totals.setdefault(key, {"count": 0, "errors": 0, "total_us": 0, "bytes": 0,
+                                            "first_us": span["start_us"], "last_us": 0})
+            entry["count"] += 1
+            entry["errors"] += "error" in span
+            entry["total_us"] += span["duration_us"]
+            entry["bytes"] += span.get("bytes", 0)
+            entry["first_us"] = min(entry["first_us"], span["start_us"])
+            entry["last_us"] = max(entry["last_us"], span["start_us"] + span["duration_us"])
+        for entry in totals.values():
+            entry["wall_us"] = entry["last_us"] - entry["first_us"]
+        return totals
+
+    def export_json(self, path):
+        with open(path, "w") as f:
+            json.dump(self.spans(), f, indent=2, default=str)
+
+    def export_chrome_trace(self, path):
+        """
+        Write the spans in Chrome trace-event format (load it in
+        chrome://tracing or https://ui.perfetto.dev).
+        """
+        events = []
+        for span in self.spans():
+            name = span["stage"] if span["dataset"] is None else f"{span['stage']}:{span['dataset']}"
+            args = {k: v for k, v in span.items()
+                    if k not in ("stage", "start_us", "duration_us", "pid", "tid")}
+            events.append({
+                "name": name,
+                "cat": span["stage"],
+                "ph": "X",
+                "ts": span["start_us"],
+                "dur": span["duration_us"],
+                "pid": span["pid"],
+                "tid": span["tid"],
+                "args": args,
+            })
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, default=str)
+
+    def print_summary(self, group_by=("engine",)):
+        # "Sum" adds up (possibly overlapping) span durations; "Wall" is the
+        # stage's first-start to last-end window, and MB/s is bytes over Wall,
+        # i.e. aggregate throughput. Bytes and MB/s only apply to transfers.
+        header = " ".join(f"{tag.capitalize():<10}" for tag in group_by)
+        print(f"{header} {'Stage':<12} {'Spans':>6} {'Errors':>6} {'Sum (s)':>9} {'Wall (s)':>9} {'Bytes':>12} {'MB/s':>8}")
+        for key, entry in self.summary(group_by).items():
+            *groups, stage = key
+            seconds = entry["total_us"] / 1_000_000
+            wall = entry["wall_us"] / 1_000_000
+            size = f"{entry['bytes']:>12,}" if entry["bytes"] else f"{'-':>12}"
+            rate = f"{entry['bytes'] / wall / 1_000_000:8.2f}" if entry["bytes"] and wall else f"{'-':>8}"
+            labels = " ".join(f"{'-' if g is None else str(g):<10}" for g in groups)
+            print(f"{labels} {stage:<12} {entry['count']:>6} {entry['errors']:>6} {seconds:>9.4f} {wall:>9.4f} {size} {rate}")
@@ -0,0 +1,162 @@
+# Index layer over the population.csv rows (Country Name, Country Code, Year, Value)
+#
+# The rows are indexed once when the index is built:
+#   - a hash index by Year, by Country Name, by Country Code and by (Code, Year)
+#   - a sorted list of years for range queries (e.g. 2000-2020)
+#   - region membership as bitsets over dense country ids
+#
+# After that, point and range queries only touch the matching rows.
+from bisect import bisect_left, bisect_right
+
+
+# ISO 3166-1 alpha-3 codes of the 54 African countries.
+# Codes are used instead of names because the dataset spells names its own
+# way (e.g. "Congo, Dem. Rep." rather than "DR Congo").
+AFRICA_CODES = frozenset({
+    'DZA', 'AGO', 'BEN', 'BWA', 'BFA', 'BDI', 'CPV', 'CMR', 'CAF', 'TCD',
+    'COM', 'COD', 'COG', 'CIV', 'DJI', 'EGY', 'GNQ', 'ERI', 'SWZ', 'ETH',
+    'GAB', 'GMB', 'GHA', 'GIN', 'GNB', 'KEN', 'LSO', 'LBR', 'LBY', 'MDG',
+    'MWI', 'MLI', 'MRT', 'MUS', 'MAR', 'MOZ', 'NAM', 'NER', 'NGA', 'RWA',
+    'STP', 'SEN', 'SYC', 'SLE', 'SOM', 'ZAF', 'SSD', 'SDN', 'TZA', 'TGO',
+    'TUN', 'UGA', 'ZMB', 'ZWE',
+})
+
+# Region name -> set of country codes. Add regions here to make them queryable.
+REGIONS = {
+    'Africa': AFRICA_CODES,
+}
+
+
+class PopulationIndex:
+    """
+    Read-only indexes over a list of population rows (csv.DictReader dicts).
+
+    The rows themselves are never modified; every query returns the original
+    row dicts in load order.
+    """
+
+    def __init__(self, rows, regions=None):
+        self._rows = rows
+        self._by_year = {}
+        self._by_name = {}
+        self._by_code = {}
+        self._by_code_year = {}  # (Country Code, Year) -> row ids
+        self._country_ids = {}   # Country Code -> dense id (bit position)
+        self._codes = []         # dense id -> Country Code
+
+        for row_id, row in enumerate(rows):
+            year = int(row["Year"])
+            code = row["Country Code"]
+            self._by_year.setdefault(year, []).append(row_id)
+            self._by_name.setdefault(row["Country Name"], []).append(row_id)
+            self._by_code.setdefault(code, []).append(row_id)
+            self._by_code_year.setdefault((code, year), []).append(row_id)
+            if code not in self._country_ids:
+                self._country_ids[code] = len(self._codes)
+                self._codes.append(code)
+
+        self._years = sorted(self._by_year)
+
+        # Precompute one bitset per region: bit i is set when country id i belongs to it
+        self._region_bits = {}
+        for region, codes in (REGIONS if regions is None else regions).items():
+            bits = 0
+            for code in codes:
+                country_id = self._country_ids.get(code)
+                if country_id is not None:
+                    bits |= 1 << country_id
+            self._region_bits[region] = bits
+
+    def __len__(self):
+        return len(self._rows)
+
+    @property
+    def years(self):
+        return list(self._years)
+
+    @property
+    def regions(self):
+        return list(self._region_bits)
+
+    def _row_ids_for_years(self, start, end):
+        # Row ids for every year in the inclusive range [start, end]
+        lo = bisect_left(self._years, start)
+        hi = bisect_right(self._years, end)
+        for year in self._years[lo:hi]:
+            yield from self._by_year[year]
+
+    def _row_ids_for_codes_years(self, codes, start, end):
+        # Row ids for the given countries in [start, end], via the (code, year) index
+        lo = bisect_left(self._years, start)
+        hi = bisect_right(self._years, end)
+        years = self._years[lo:hi]
+        return sorted(
+            i for code in codes for year in years for i in self._by_code_year.get((code, year), ())
+        )
+
+    def by_year(self, year):
+        return [self._rows[i] for i in self._by_year.get(int(year), ())]
+
+    def by_year_range(self, start, end):
+        return [self._rows[i] for i in self._row_ids_for_years(int(start), int(end))]
+
+    def by_country(self, country):
+        # Accepts either a Country Name or a Country Code
+        row_ids = self._by_name.get(country) or self._by_code.get(country, ())
+        return [self._rows[i] for i in row_ids]
+
+    def _codes_in(self, bits):
+        # Country codes whose bit is set, lowest country id first
+        codes = []
+        while bits:
+            low = bits & -bits
+            codes.append(self._codes[low.bit_length() - 1])
+            bits ^= low
+        return codes
+
+    def in_region(self, country_code, region):
+        country_id = self._country_ids.get(country_code)
+        if country_id is None:
+            return False
+        return bool(self._region_bits[region] >> country_id & 1)
+
+    def query(self, year=None, years=None, country=None, region=None):
+        """
+        Return the rows matching every given filter.
+
+        year    -- a single year (int or str)
+        years   -- an inclusive (start, end) tuple of years
+        country -- a Country Name or Country Code
+        region  -- a region name from REGIONS (e.g. 'Africa')
+
+        Country and region filters are resolved to country codes first; with a
+        year filter too, the (code, year) index is probed for each code, so the
+        cost follows the number of matching rows rather than rows per year.
+        """
+        if year is not None and years is not None:
+            raise ValueError("Pass either year or years, not both")
+        if region is not None and region not in self._region_bits:
+            raise KeyError(f"Unknown region: {region}")
+
+        if year is not None:
+            years = (int(year), int(year))
+        elif years is not None:
+            years = (int(years[0]), int(years[1]))
+
+        if country is not None:
+            row_ids = self._by_name.get(country) or self._by_code.get(country, ())
+            codes = {self._rows[row_ids[0]]["Country Code"]} if row_ids else set()
+            if region is not None:
+                codes = {code for code in codes if self.in_region(code, region)}
+        elif region is not None:
+            codes = self._codes_in(self._region_bits[region])
+        elif years is not None:
+            return [self._rows[i] for i in self._row_ids_for_years(*years)]
+        else:
+            return list(self._rows)
+
+        if years is not None:
+            row_ids = self._row_ids_for_codes_years(codes, *years)
+        else:
+            row_ids = sorted(i for code in codes for i in self._by_code[code])
+        return [self._rows[i] for i in row_ids]
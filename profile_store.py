@@ -0,0 +1,136 @@
+# Local SQLite store for GitHub profiles fetched by question6.py.
+#
+# Each profile is stored once per login with the time it was fetched, so a
+# later run can refresh only the stale ones and answer queries such as
+# "top users by public_repos" without touching the network.
+import json
+import sqlite3
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    login        TEXT PRIMARY KEY COLLATE NOCASE,
+    name         TEXT,
+    public_repos INTEGER,
+    html_url     TEXT,
+    data         TEXT NOT NULL,
+    fetched_at   REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_profiles_public_repos ON profiles (public_repos);
+CREATE INDEX IF NOT EXISTS idx_profiles_fetched_at ON profiles (fetched_at);
+"""
+
+UPSERT = """
+INSERT INTO profiles (login, name, public_repos, html_url, data, fetched_at)
+VALUES (:login, :name, :public_repos, :html_url, :data, :fetched_at)
+ON CONFLICT (login) DO UPDATE SET
+    name = excluded.name,
+    public_repos = excluded.public_repos,
+    html_url = excluded.html_url,
+    data = excluded.data,
+    fetched_at = excluded.fetched_at
+"""
+
+
+class ProfileStore:
+    """
+    SQLite-backed store of GitHub user profiles keyed by login
+    (case-insensitive). Use as a context manager or call close().
+    """
+
+    def __init__(self, path: str = "github_profiles.db"):
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._conn.close()
+
+    def upsert_profiles(self, profiles: Iterable[Dict[str, Any]], fetched_at: Optional[float] = None) -> int:
+        """
+        Insert or update profiles as returned by fetch_many_users().
+        Entries carrying an "error" key are skipped. Returns the number stored.
+        """
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        rows = [
+            {
+                "login": p["login"],
+                "name": p.get("name"),
+                "public_repos": p.get("public_repos"),
+                "html_url": p.get("html_url"),
+                "data": json.dumps(p),
+                "fetched_at": fetched_at,
+            }
+            for p in profiles if not p.get("error") and p.get("login")
+        ]
+        with self._conn:
+            self._conn.executemany(UPSERT, rows)
+        return len(rows)
+
+    def upsert_retry_results(self, usernames: List[str], results: List[Tuple[Any, Any]],
+                             fetched_at: Optional[float] = None) -> int:
+        """
+        Insert or update the (json, error) pairs returned by
+        fetch_many_with_retry() for `usernames`. Failed fetches are skipped.
+        """
+        return self.upsert_profiles(
+            (res_json for _, (res_json, err) in zip(usernames, results) if err is None and res_json),
+            fetched_at,
+        )
+
+    def stale_logins(self, usernames: List[str], max_age: float, now: Optional[float] = None) -> List[str]:
+        """
+        The usernames that are missing from the store or were fetched more
+        than `max_age` seconds ago, in the order given.
+        """
+        now = time.time() if now is None else now
+        fresh = set()
+        # Stay well under SQLite's bound-parameter limit on large user lists
+        for start in range(0, len(usernames), 500):
+            chunk = usernames[start:start + 500]
+            marks = ",".join("?" * len(chunk))
+            fresh.update(
+                row["login"].lower() for row in self._conn.execute(
+                    f"SELECT login FROM profiles WHERE login IN ({marks}) AND fetched_at >= ?",
+                    (*chunk, now - max_age),
+                )
+            )
+        return [u for u in usernames if u.lower() not in fresh]
+
+    def get(self, login: str) -> Optional[Dict[str, Any]]:
+        row = self._conn.execute("SELECT data, fetched_at FROM profiles WHERE login = ?", (login,)).fetchone()
+        if row is None:
+            return None
+        profile = json.loads(row["data"])
+        profile["fetched_at"] = row["fetched_at"]
+        return profile
+
+    def top_by_public_repos(self, limit: int = 5, logins: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Stored profiles with the most public repos, optionally only among
+        `logins`; otherwise across the whole store. Served by
+        idx_profiles_public_repos.
+        """
+        query = ("SELECT login, name, public_repos, html_url, fetched_at FROM profiles "
+                 "WHERE public_repos IS NOT NULL {} ORDER BY public_repos DESC LIMIT ?")
+        if logins is None:
+            return [dict(row) for row in self._conn.execute(query.format(""), (limit,))]
+        top = []
+        # Same chunking as stale_logins(); each chunk's top `limit` is merged below
+        for start in range(0, len(logins), 500):
+            chunk = logins[start:start + 500]
+            marks = ",".join("?" * len(chunk))
+            top.extend(dict(row) for row in self._conn.execute(
+                query.format(f"AND login IN ({marks})"), (*chunk, limit)))
+        return sorted(top, key=lambda row: row["public_repos"], reverse=True)[:limit]
+
+    def count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
@@ -4,6 +4,8 @@ import urllib.request
 from functools import reduce
 import time
 
+from population_index import PopulationIndex
+
 
 # 1. Read the CSV using the csv module
 
@@ -19,16 +21,20 @@ print(f"Total records loaded: {len(data)}")
 print("\nOriginal Data Sample (before transformations):")
 print(data[:3])
 
+# Build the Year / Country / region indexes once; queries below use them
+index = PopulationIndex(data)
+
 # 2. Filter rows for Year == "2020"
 
-data_2020 = list(filter(lambda row: row["Year"] == "2020", data))
+data_2020 = index.by_year(2020)
 
 
 # 3. Map to tuples (Country Name, Population)
 
-country_population = list(
-    map(lambda row: (row["Country Name"], int(float(row["Value"]))), data_2020)
-)
+def to_country_pop(data):
+    return list(map(lambda r: (r["Country Name"], int(float(r["Value"]))), data))
+
+country_population = to_country_pop(data_2020)
 
 
 # 4. Sort and print top 5 most populated countries
@@ -46,18 +52,10 @@ total_population = reduce(lambda acc, x: acc + x[1], country_population, 0)
 print(f"\nTotal World Population (2020): {total_population:,}")
 
 
-# 6. Average population for African countries using filter + reduce
-
-# For simplicity, we'll use a known list of African countries
-african_countries = {
-    'Nigeria', 'Ethiopia', 'Egypt', 'DR Congo', 'Tanzania', 'South Africa',
-    'Kenya', 'Uganda', 'Algeria', 'Sudan', 'Morocco', 'Angola', 'Ghana',
-    'Mozambique', 'Madagascar', 'Cameroon', 'Côte d\'Ivoire', 'Niger',
-    'Burkina Faso', 'Mali', 'Malawi', 'Zambia', 'Senegal', 'Chad', 'Somalia',
-    'Zimbabwe', 'Guinea', 'Rwanda', 'Benin', 'Burundi'
-}
+# 6. Average population for African countries using an indexed region query + reduce
 
-africa_data = list(filter(lambda x: x[0] in african_countries, country_population))
+# Region membership comes from the index (ISO country codes), not a name list
+africa_data = to_country_pop(index.query(year=2020, region="Africa"))
 africa_total = reduce(lambda acc, x: acc + x[1], africa_data, 0)
 africa_avg = africa_total / len(africa_data) if africa_data else 0
 print(f"\nAverage Population for African countries (2020): {africa_avg:,.0f}")
@@ -87,17 +85,14 @@ def compose(*funcs):
     """Function composition utility"""
     return lambda x: reduce(lambda acc, f: f(acc), reversed(funcs), x)
 
-def filter_2020(data):
-    return list(filter(lambda r: r["Year"] == "2020", data))
-
-def to_country_pop(data):
-    return list(map(lambda r: (r["Country Name"], int(float(r["Value"]))), data))
+def filter_2020(index):
+    return index.by_year(2020)
 
 def sort_top5(data):
     return sorted(data, key=lambda x: x[1], reverse=True)[:5]
 
 pipeline = compose(sort_top5, to_country_pop, filter_2020)
-top5_pipeline = pipeline(data)
+top5_pipeline = pipeline(index)
 
 print("\nFunctional Pipeline Result (Top 5 countries):")
 for c, p in top5_pipeline:
@@ -116,4 +111,11 @@ end_list = time.time()
 
 print("\nPerformance comparison:")
 print(f"Functional map() time: {end_func - start_func:.6f}s")
-print(f"List comprehension time: {end_list - start_list:.6f}s")
\ No newline at end of file
+print(f"List comprehension time: {end_list - start_list:.6f}s")
+
+# 11. Indexed point and range queries
+
+uganda_2000_2020 = index.query(years=(2000, 2020), country="UGA")
+print(f"\nUganda population 2000-2020 ({len(uganda_2000_2020)} rows):")
+for row in uganda_2000_2020[::5]:
+    print(f"{row['Year']}: {int(float(row['Value'])):,}")
@@ -1,12 +1,23 @@
 
+import argparse
+import asyncio
+import csv
 import threading
 import time
+import aiohttp
 import requests
 import pandas as pd
 import io
-from multiprocessing import Process, Queue
+import multiprocessing
+import os
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+import contextlib
 import sys
 
+from analysis_registry import register_analysis, analyses_for, plan_parse
+from instrumentation import Tracer, now_us
+from standin_server import resolve_url
+
 
 
 def print_numbers(thread_name):
@@ -44,28 +55,59 @@ def question_5a():
 # QUESTION 5B: Real Dataset Processing with Threading
 
 
-# Dataset URLs
+# Dataset URLs (served by the local stand-in instead when STANDIN_BASE_URL is set)
 DATASETS = {
-    'population': 'https://raw.githubusercontent.com/datasets/population/master/data/population.csv',
-    'covid': 'https://raw.githubusercontent.com/owid/covid-19-data/master/public/data/latest/owid-covid-latest.csv',
-    'temperature': 'https://datahub.io/core/global-temp/r/annual.csv'
+    'population': resolve_url('https://raw.githubusercontent.com/datasets/population/master/data/population.csv'),
+    'covid': resolve_url('https://raw.githubusercontent.com/owid/covid-19-data/master/public/data/latest/owid-covid-latest.csv'),
+    'temperature': resolve_url('https://datahub.io/core/global-temp/r/annual.csv')
 }
 
 # Thread-safe storage for downloaded data
 data_lock = threading.Lock()
 downloaded_data = {}
 
+# Per-stage spans (download, decode, parse, compute, ...) for the whole run
+tracer = Tracer()
+TRACE_JSON = "question5_trace.json"
+TRACE_CHROME = "question5_trace.chrome.json"
+
+
+def fetch_csv_text(dataset_name, url, tracer):
+    # Download and decode one dataset, recording both stages as spans
+    with tracer.span("download", dataset_name, url=url) as attrs:
+        response = requests.get(url, timeout=30)
+        response.raise_for_status()
+        payload = response.content
+        attrs["bytes"] = len(payload)
+    with tracer.span("decode", dataset_name, input_size=len(payload)):
+        return payload.decode(response.encoding or "utf-8")
+
+
+def parse_csv(dataset_name, csv_data, tracer, columns=None, dtypes=None):
+    # Parse the CSV, keeping only `columns` (all when None) with explicit dtypes.
+    # Requested columns missing from the header are skipped, not an error.
+    with tracer.span("parse", dataset_name, chars=len(csv_data)) as attrs:
+        usecols = None
+        if columns is not None:
+            end = csv_data.find('\n')
+            header = next(csv.reader([csv_data if end == -1 else csv_data[:end]]), [])
+            usecols = [col for col in header if col in columns]
+        if dtypes and usecols is not None:
+            dtypes = {col: dtype for col, dtype in dtypes.items() if col in usecols}
+        df = pd.read_csv(io.StringIO(csv_data), usecols=usecols, dtype=dtypes or None)
+        attrs["columns"] = len(df.columns)
+        return df
+
 def download_dataset(dataset_name, url):
    #downloads the dataset from a given url of the dataset_name attribute value
     print(f"[{dataset_name}] Starting download from {url}")
     
     try:
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
+        text = fetch_csv_text(dataset_name, url, tracer)
         
         # Store data in thread-safe manner
         with data_lock:
-            downloaded_data[dataset_name] = response.text
+            downloaded_data[dataset_name] = text
         
         print(f"[{dataset_name}] Download completed successfully")
     except Exception as e:
@@ -73,92 +115,266 @@ def download_dataset(dataset_name, url):
         with data_lock:
             downloaded_data[dataset_name] = None
 
-def process_population_data():
 
-    #Thread 1: Compute total world population for 2020.
-    
-    print("\n[Population Analysis] Starting processing...")
-    
-    try:
-        with data_lock:
-            csv_data = downloaded_data.get('population')
-        
-        if csv_data is None:
-            print("[Population Analysis] No data available")
-            return
-        
-        df = pd.read_csv(io.StringIO(csv_data))
-        
-        # Filter for year 2020 and sum population
-        if 'Year' in df.columns and 'Value' in df.columns:
-            pop_2020 = df[df['Year'] == 2020]['Value'].sum()
-            print(f"[Population Analysis] Total World Population (2020): {pop_2020:,.0f}")
+# Registered analyses: each one takes the parsed DataFrame of its dataset and
+# returns a single value. run_analyses() decides where each one runs, and
+# parses each dataset once with only the columns its analyses declare.
+
+TEMPERATURE_COLUMNS = ['Mean', 'MEAN', 'mean', 'temperature', 'Temperature']
+
+@register_analysis("population_2020", dataset="population", columns=["Year", "Value"],
+                   dtypes={"Year": "int64", "Value": "float64"}, kind="cpu",
+                   label="Total World Population (2020)", fmt="{:,.0f}")
+def population_total_2020(df):
+    return df[df['Year'] == 2020]['Value'].sum()
+
+@register_analysis("covid_new_cases", dataset="covid", columns=["new_cases"],
+                   dtypes={"new_cases": "float64"}, kind="cpu",
+                   label="Total New COVID Cases", fmt="{:,.0f}")
+def covid_total_new_cases(df):
+    return df['new_cases'].sum()
+
+@register_analysis("temperature_mean", dataset="temperature", columns=TEMPERATURE_COLUMNS,
+                   dtypes={col: "float64" for col in TEMPERATURE_COLUMNS}, kind="cpu",
+                   label="Average Global Temperature", fmt="{:.2f}°C")
+def temperature_mean(df):
+    # Look for common temperature column names
+    temp_col = next((col for col in TEMPERATURE_COLUMNS if col in df.columns), None)
+    if temp_col is None:
+        # The parse only keeps TEMPERATURE_COLUMNS, so name those rather than df.columns
+        raise KeyError(f"Temperature column not found; expected one of {list(TEMPERATURE_COLUMNS)}")
+    return df[temp_col].mean()
+
+
+# Scheduler. Every engine runs the same analyses and returns the same results:
+#   'thread'  -> downloads and analyses on the thread pool
+#   'process' -> downloads on the thread pool, analyses on the process pool
+#   'auto'    -> per dataset: its analyses run on the process pool if any of
+#                them is of kind 'cpu', on the thread pool if all are 'io'
+#   'asyncio' -> aiohttp downloads, analyses inline on the event loop
+#   'hybrid'  -> aiohttp downloads, analyses handed to the process pool
+# Every engine starts a dataset's analyses as soon as its download finishes.
+# io_workers sizes the thread pool (default IO_WORKERS); for the asyncio
+# engines it caps concurrent downloads and the aiohttp connection pool. When it
+# is None they run unbounded (TCPConnector limit=0, not aiohttp's default 100).
+ENGINES = ('thread', 'process', 'auto', 'asyncio', 'hybrid')
+IO_WORKERS = 8
+CPU_WORKERS = os.cpu_count() or 1
+
+# Worker processes are spawned rather than forked: the pool only starts them
+# on submit, after the download threads are already running, and forking a
+# multi-threaded process can copy locks held by those threads.
+def process_pool(max_workers):
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn'))
+
+# Dataset copies made by replicate_datasets() are named '<dataset>#<n>'
+REPLICA_SEP = '#'
+
+def dataset_base(dataset_name):
+    return dataset_name.split(REPLICA_SEP)[0]
+
+def replicate_datasets(count, datasets=None):
+    """
+    Return `count` datasets by cycling through `datasets` (default: DATASETS).
+    Copies get a distinct name and URL so each one is a separate download.
+    """
+    datasets = DATASETS if datasets is None else datasets
+    names = list(datasets)
+    replicas = {}
+    for i in range(count):
+        name = names[i % len(names)]
+        copy = i // len(names)
+        if copy == 0:
+            replicas[name] = datasets[name]
         else:
-            print("[Population Analysis] Expected columns not found")
-            
-    except Exception as e:
-        print(f"[Population Analysis] Error: {str(e)}")
+            url = datasets[name]
+            replicas[f"{name}{REPLICA_SEP}{copy}"] = f"{url}{'&' if '?' in url else '?'}copy={copy}"
+    return replicas
 
-def process_covid_data():
-    
-    #Thread 2: Compute total new COVID cases.
-    
-    print("\n[COVID Analysis] Starting processing...")
-    
+def execute_dataset(funcs, dataset_name, csv_data, columns, dtypes, submitted_at):
+    # Runs inside a pool worker, thread or process alike. Parses the dataset
+    # once with the planned columns and dtypes and runs every analysis on that
+    # one frame. It records into its own Tracer and returns the spans with the
+    # (result, error) pairs for the caller to merge.
+    worker_tracer = Tracer()
+    worker_tracer.record("queue_wait", submitted_at, now_us(), dataset_name)
     try:
-        with data_lock:
-            csv_data = downloaded_data.get('covid')
-        
-        if csv_data is None:
-            print("[COVID Analysis] No data available")
-            return
-        
-        df = pd.read_csv(io.StringIO(csv_data))
-        
-        # Sum total new cases
-        if 'new_cases' in df.columns:
-            total_cases = df['new_cases'].sum()
-            print(f"[COVID Analysis] Total New COVID Cases: {total_cases:,.0f}")
-        else:
-            print("[COVID Analysis] 'new_cases' column not found")
-            
+        df = parse_csv(dataset_name, csv_data, worker_tracer, columns, dtypes)
     except Exception as e:
-        print(f"[COVID Analysis] Error: {str(e)}")
+        return [(None, str(e))] * len(funcs), worker_tracer.spans()
+    outcomes = []
+    for func in funcs:
+        try:
+            with worker_tracer.span("compute", dataset_name, analysis=func.__name__):
+                outcomes.append((func(df), None))
+        except Exception as e:
+            outcomes.append((None, str(e)))
+    return outcomes, worker_tracer.spans()
 
-def process_temperature_data():
+class DatasetJob:
     """
-    Thread 3: Compute average global temperature.
+    The analyses to run over one dataset, and how to parse it for them.
     """
-    print("\n[Temperature Analysis] Starting processing...")
-    
+
+    def __init__(self, name, analyses, plan):
+        self.name = name
+        self.analyses = analyses
+        self.columns, self.dtypes = plan
+
+    def args(self, csv_data):
+        # Arguments for execute_dataset()
+        return [a.func for a in self.analyses], self.name, csv_data, self.columns, self.dtypes, now_us()
+
+    def missing(self):
+        return [(analysis, self.name, None, "No data available") for analysis in self.analyses]
+
+    def collect(self, outcome):
+        # Unpack an execute_dataset() result (or the exception raised getting it)
+        if isinstance(outcome, BaseException):
+            return [(analysis, self.name, None, str(outcome)) for analysis in self.analyses]
+        outcomes, spans = outcome
+        tracer.merge(spans)
+        return [(analysis, self.name, result, error)
+                for analysis, (result, error) in zip(self.analyses, outcomes)]
+
+def plan_jobs(datasets):
+    # One DatasetJob per dataset; copies of a dataset share its parse plan
+    plans = {}
+    jobs = []
+    for name in datasets:
+        base = dataset_base(name)
+        analyses = analyses_for([base])
+        if not analyses:
+            continue
+        if base not in plans:
+            plans[base] = plan_parse(analyses)
+        jobs.append(DatasetJob(name, analyses, plans[base]))
+    return jobs
+
+def run_analyses(engine='auto', datasets=None, texts=None, io_workers=None, cpu_workers=CPU_WORKERS):
+    """
+    Run every registered analysis over `datasets` (default: DATASETS).
+
+    The datasets are downloaded first unless `texts` already maps each
+    dataset name to its CSV text. Each dataset is parsed once, with only the
+    columns its analyses declare. Returns (analysis, dataset, result, error)
+    tuples, grouped by dataset; error is None on success.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"engine must be one of {ENGINES}, got {engine!r}")
+    datasets = DATASETS if datasets is None else datasets
+    jobs = plan_jobs(datasets)
+
+    if engine in ('asyncio', 'hybrid'):
+        return asyncio.run(run_analyses_async(engine, datasets, jobs, texts, io_workers, cpu_workers))
+
+    def on_process_pool(job):
+        return engine == 'process' or (engine == 'auto' and any(a.kind == 'cpu' for a in job.analyses))
+
+    cpu_pool = None
+    if any(on_process_pool(job) for job in jobs):
+        cpu_pool = process_pool(cpu_workers)
     try:
-        with data_lock:
-            csv_data = downloaded_data.get('temperature')
-        
+        with ThreadPoolExecutor(max_workers=io_workers or IO_WORKERS) as io_pool:
+            # job name -> analysis future, or None when there is no data
+            futures = {}
+
+            def submit(job, csv_data):
+                if csv_data is None:
+                    futures[job.name] = None
+                    return
+                pool = cpu_pool if on_process_pool(job) else io_pool
+                futures[job.name] = pool.submit(execute_dataset, *job.args(csv_data))
+
+            if texts is not None:
+                for job in jobs:
+                    submit(job, texts.get(job.name))
+            else:
+                # Hand each dataset to its analyses as soon as it has downloaded
+                downloads = {io_pool.submit(fetch_csv_text, job.name, datasets[job.name], tracer): job
+                             for job in jobs}
+                for download in as_completed(downloads):
+                    job = downloads.pop(download)
+                    try:
+                        csv_data = download.result()
+                    except Exception as e:
+                        print(f"[{job.name}] Error downloading: {str(e)}")
+                        csv_data = None
+                    submit(job, csv_data)
+
+            results = []
+            for job in jobs:
+                future = futures[job.name]
+                if future is None:
+                    results.extend(job.missing())
+                    continue
+                try:
+                    outcome = future.result()
+                except Exception as e:
+                    outcome = e
+                results.extend(job.collect(outcome))
+            return results
+    finally:
+        if cpu_pool is not None:
+            cpu_pool.shutdown()
+
+async def fetch_csv_text_async(session, dataset_name, url, tracer):
+    # aiohttp counterpart of fetch_csv_text()
+    with tracer.span("download", dataset_name, url=url) as attrs:
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
+            response.raise_for_status()
+            payload = await response.read()
+            encoding = response.charset or "utf-8"
+        attrs["bytes"] = len(payload)
+    with tracer.span("decode", dataset_name, input_size=len(payload)):
+        return payload.decode(encoding)
+
+async def run_analyses_async(engine, datasets, jobs, texts, io_workers, cpu_workers):
+    # The 'asyncio' and 'hybrid' engines of run_analyses()
+    loop = asyncio.get_running_loop()
+    download_slots = asyncio.Semaphore(io_workers) if io_workers else contextlib.nullcontext()
+
+    async def run_job(session, job):
+        if texts is not None:
+            csv_data = texts.get(job.name)
+        else:
+            csv_data = None
+            wait_start = now_us()
+            async with download_slots:
+                tracer.record("queue_wait", wait_start, now_us(), job.name)
+                try:
+                    csv_data = await fetch_csv_text_async(session, job.name, datasets[job.name], tracer)
+                except Exception as e:
+                    print(f"[{job.name}] Error downloading: {str(e)}")
+
         if csv_data is None:
-            print("[Temperature Analysis] No data available")
-            return
-        
-        df = pd.read_csv(io.StringIO(csv_data))
-        
-        # Calculate average temperature
-        # Look for common temperature column names
-        temp_columns = ['Mean', 'MEAN', 'mean', 'temperature', 'Temperature']
-        temp_col = None
-        
-        for col in temp_columns:
-            if col in df.columns:
-                temp_col = col
-                break
-        
-        if temp_col:
-            avg_temp = df[temp_col].mean()
-            print(f"[Temperature Analysis] Average Global Temperature: {avg_temp:.2f}°C")
+            return job.missing()
+        if cpu_pool is None:
+            return job.collect(execute_dataset(*job.args(csv_data)))
+        try:
+            outcome = await loop.run_in_executor(cpu_pool, execute_dataset, *job.args(csv_data))
+        except Exception as e:
+            outcome = e
+        return job.collect(outcome)
+
+    cpu_pool = process_pool(cpu_workers) if engine == 'hybrid' else None
+    try:
+        connector = aiohttp.TCPConnector(limit=io_workers or 0)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            per_dataset = await asyncio.gather(*(run_job(session, job) for job in jobs))
+    finally:
+        if cpu_pool is not None:
+            cpu_pool.shutdown()
+    return [result for results in per_dataset for result in results]
+
+def print_results(results):
+    for analysis, name, result, error in results:
+        label = analysis.name if name == analysis.dataset else f"{analysis.name}@{name}"
+        if error is None:
+            print(f"[{label}] {analysis.format(result)}")
         else:
-            print(f"[Temperature Analysis] Temperature column not found. Available columns: {df.columns.tolist()}")
-            
-    except Exception as e:
-        print(f"[Temperature Analysis] Error: {str(e)}")
+            print(f"[{label}] Error: {error}")
+
 
 def question_5b_part_a():
     """
@@ -192,20 +408,10 @@ def question_5b_part_b():
     print("QUESTION 5B - PART B: Concurrent Data Processing")
     print("=" * 60)
     
-    # Create processing threads
-    processing_threads = [
-        threading.Thread(target=process_population_data, name="PopulationThread"),
-        threading.Thread(target=process_covid_data, name="COVIDThread"),
-        threading.Thread(target=process_temperature_data, name="TemperatureThread")
-    ]
-    
-    # Start all processing threads
-    for thread in processing_threads:
-        thread.start()
-    
-    # Wait for all processing to complete
-    for thread in processing_threads:
-        thread.join()
+    # Run every registered analysis over the data downloaded in Part A
+    with data_lock:
+        texts = dict(downloaded_data)
+    print_results(run_analyses('thread', texts=texts))
     
     print("\n[Main Thread] All processing completed")
 
@@ -213,120 +419,84 @@ def question_5b_part_b():
 # QUESTION 5B - PART C (BONUS): Multiprocessing Comparison
 
 
-def download_and_process_multiprocess(dataset_name, url, result_queue):
-    #function for multiprocessing ie. download and process data
-    try:
-        # Download
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        
-        # Simple processing based on dataset
-        df = pd.read_csv(io.StringIO(response.text))
-        
-        if dataset_name == 'population':
-            result = df[df['Year'] == 2020]['Value'].sum() if 'Year' in df.columns else 0
-        elif dataset_name == 'covid':
-            result = df['new_cases'].sum() if 'new_cases' in df.columns else 0
-        elif dataset_name == 'temperature':
-            temp_cols = ['Mean', 'MEAN', 'mean']
-            temp_col = next((col for col in temp_cols if col in df.columns), None)
-            result = df[temp_col].mean() if temp_col else 0
-        else:
-            result = 0
-        
-        result_queue.put((dataset_name, result))
-    except Exception as e:
-        result_queue.put((dataset_name, f"Error: {str(e)}"))
+# Engines compared in Part C, and how many datasets to run them over
+COMPARE_ENGINES = ('thread', 'process', 'asyncio', 'hybrid')
+ENGINE_LABELS = {
+    'thread': 'Threading',
+    'process': 'Multiprocessing',
+    'auto': 'Auto (by kind)',
+    'asyncio': 'Asyncio',
+    'hybrid': 'Hybrid (async + processes)',
+}
 
-def question_5b_part_c():
+def question_5b_part_c(dataset_counts=(len(DATASETS),), engines=COMPARE_ENGINES,
+                       io_workers=None, cpu_workers=CPU_WORKERS):
     """
-    Part C (Bonus): Compare threading vs multiprocessing performance.
+    Part C (Bonus): Compare the engines' performance, once per dataset count.
     """
     print("\n" + "=" * 60)
     print("QUESTION 5B - PART C (BONUS): Performance Comparison")
     print("=" * 60)
     
-    # Test 1: Threading approach
-    print("\n[Performance Test] Running with Threading...")
-    start_threading = time.perf_counter()
-    
-    # Clear previous data
-    downloaded_data.clear()
-    
-    # Download with threads
-    download_threads = []
-    for name, url in DATASETS.items():
-        thread = threading.Thread(target=download_dataset, args=(name, url))
-        download_threads.append(thread)
-        thread.start()
-    
-    for thread in download_threads:
-        thread.join()
-    
-    # Process with threads
-    processing_threads = [
-        threading.Thread(target=process_population_data),
-        threading.Thread(target=process_covid_data),
-        threading.Thread(target=process_temperature_data)
-    ]
-    
-    for thread in processing_threads:
-        thread.start()
-    
-    for thread in processing_threads:
-        thread.join()
-    
-    end_threading = time.perf_counter()
-    threading_time = end_threading - start_threading
-    
-    # Test 2: Multiprocessing approach
-    print("\n[Performance Test] Running with Multiprocessing...")
-    start_multiprocess = time.perf_counter()
-    
-    result_queue = Queue()
-    processes = []
-    
-    for name, url in DATASETS.items():
-        process = Process(target=download_and_process_multiprocess, 
-                         args=(name, url, result_queue))
-        processes.append(process)
-        process.start()
-    
-    for process in processes:
-        process.join()
-    
-    # Retrieve results
-    results = []
-    while not result_queue.empty():
-        results.append(result_queue.get())
-    
-    end_multiprocess = time.perf_counter()
-    multiprocess_time = end_multiprocess - start_multiprocess
+    # Only trace the comparison runs
+    tracer.clear()
+    
+    # runtimes[count][engine] -> seconds
+    runtimes = {}
+    for count in dataset_counts:
+        datasets = replicate_datasets(count)
+        runtimes[count] = {}
+        for engine in engines:
+            print(f"\n[Performance Test] Running with {ENGINE_LABELS[engine]} over {count} datasets...")
+            start = time.perf_counter()
+            engine_start = now_us()
+            
+            with tracer.tagged(engine=engine, datasets=count):
+                results = run_analyses(engine, datasets, io_workers=io_workers, cpu_workers=cpu_workers)
+            
+            runtimes[count][engine] = time.perf_counter() - start
+            with tracer.tagged(engine=engine, datasets=count):
+                tracer.record("engine", engine_start, now_us())
+            
+            # Full results for the plain run; just a tally once datasets are replicated
+            if count <= len(DATASETS):
+                print_results(results)
+            else:
+                failed = sum(1 for *_, error in results if error is not None)
+                print(f"[{engine}] {len(results) - failed} analyses ok, {failed} failed")
     
     # Display comparison
     print("\n" + "=" * 60)
-    print("PERFORMANCE COMPARISON RESULTS")
+    print("PERFORMANCE COMPARISON RESULTS (seconds)")
     print("=" * 60)
-    print(f"Threading Runtime:       {threading_time:.4f} seconds")
-    print(f"Multiprocessing Runtime: {multiprocess_time:.4f} seconds")
-    print(f"Difference:              {abs(threading_time - multiprocess_time):.4f} seconds")
-    
-    if threading_time < multiprocess_time:
-        speedup = multiprocess_time / threading_time
-        print(f"Threading was {speedup:.2f}x faster")
-        print("\nNote: For I/O-bound tasks (like network requests), threading")
-        print("is often more efficient due to lower overhead.")
-    else:
-        speedup = threading_time / multiprocess_time
-        print(f"Multiprocessing was {speedup:.2f}x faster")
-        print("\nNote: For CPU-bound tasks, multiprocessing typically")
-        print("performs better by utilizing multiple CPU cores.")
+    print(f"{'Datasets':>8} " + " ".join(f"{engine:>10}" for engine in engines) + "   fastest")
+    for count, times in runtimes.items():
+        fastest = min(times, key=times.get)
+        print(f"{count:>8} " + " ".join(f"{times[engine]:>10.4f}" for engine in engines) + f"   {fastest}")
+    
+    async_limit = f"at most {io_workers} connections" if io_workers else "no connection limit"
+    print(f"\nDownload concurrency: {io_workers or IO_WORKERS} pool threads; asyncio/hybrid "
+          f"{async_limit}. Analysis processes: {cpu_workers}.")
+    print("\nNote: For I/O-bound tasks (like network requests), threads and asyncio")
+    print("usually win through lower overhead; with more datasets than pool threads,")
+    print("asyncio can keep every download in flight at once. For CPU-bound parsing,")
+    print("the process pool (multiprocessing or hybrid) performs better by utilizing")
+    print("multiple CPU cores.")
+    
+    # Where the time went, per engine run and stage
+    print("\n" + "=" * 60)
+    print("PER-STAGE BREAKDOWN")
+    print("=" * 60)
+    tracer.print_summary(group_by=("engine", "datasets"))
+    tracer.export_json(TRACE_JSON)
+    tracer.export_chrome_trace(TRACE_CHROME)
+    print(f"\nSpans written to '{TRACE_JSON}' and '{TRACE_CHROME}' (Chrome trace format).")
 
 
 # MAIN EXECUTION
 
 
-def main():
+def main(dataset_counts=(len(DATASETS),), engines=COMPARE_ENGINES, io_workers=None, cpu_workers=CPU_WORKERS):
     """
     Main execution function that runs all parts of Question 5.
     """
@@ -349,7 +519,7 @@ def main():
         time.sleep(1)
         
         # Question 5b Part C: Performance comparison (Bonus)
-        question_5b_part_c()
+        question_5b_part_c(dataset_counts, engines, io_workers, cpu_workers)
         
         print("\n" + "=" * 60)
         print("ALL TASKS COMPLETED SUCCESSFULLY")
@@ -363,4 +533,24 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Question 5: concurrency on real data")
+    parser.add_argument("--datasets", default=str(len(DATASETS)),
+                        help="comma-separated dataset counts for Part C, e.g. 3,30,300")
+    parser.add_argument("--engines", default=",".join(COMPARE_ENGINES),
+                        help=f"comma-separated engines for Part C, from {', '.join(ENGINES)}")
+    parser.add_argument("--io-workers", type=int, default=None,
+                        help=f"download threads (default {IO_WORKERS}); also caps asyncio/hybrid "
+                             "downloads, which are unbounded by default")
+    parser.add_argument("--cpu-workers", type=int, default=CPU_WORKERS,
+                        help=f"analysis processes (default {CPU_WORKERS})")
+    args = parser.parse_args()
+
+    engines = tuple(args.engines.split(","))
+    unknown = [engine for engine in engines if engine not in ENGINES]
+    if unknown:
+        parser.error(f"unknown engine(s): {', '.join(unknown)} (choose from {', '.join(ENGINES)})")
+    try:
+        dataset_counts = tuple(int(n) for n in args.datasets.split(","))
+    except ValueError:
+        parser.error(f"--datasets must be comma-separated integers, got {args.datasets!r}")
+    main(dataset_counts, engines, args.io_workers, args.cpu_workers)
\ No newline at end of file
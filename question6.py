@@ -1,3 +1,4 @@
+import argparse
 import os
 import requests
 import asyncio
@@ -5,29 +6,34 @@ import aiohttp
 import aiofiles
 import random
 import time
-from typing import List, Dict, Any, Callable
+from typing import List, Dict, Any, Callable, Optional
+
+from profile_store import ProfileStore
+from standin_server import resolve_url
 
 # === Part A: Basic API Interaction (sync) ===
-GITHUB_API = "https://api.github.com/users/octocat"
+# URLs are served by the local stand-in instead when STANDIN_BASE_URL is set
+GITHUB_API = resolve_url("https://api.github.com/users/octocat")
 token = os.getenv("GITHUB_TOKEN")
 headers = {"Accept": "application/vnd.github.v3+json"}
 if token:
     headers["Authorization"] = f"token {token}"
 
-resp = requests.get(GITHUB_API, headers=headers, timeout=10)
-resp.raise_for_status()
-data = resp.json()
+def part_a():
+    resp = requests.get(GITHUB_API, headers=headers, timeout=10)
+    resp.raise_for_status()
+    data = resp.json()
 
-print("=== Part A: Basic API Interaction (sync) ===")
-print(f"Login / username: {data.get('login')}")
-print(f"Name: {data.get('name')}")
-print(f"Public repositories: {data.get('public_repos')}")
-print(f"Profile URL: {data.get('html_url')}")
-print()
+    print("=== Part A: Basic API Interaction (sync) ===")
+    print(f"Login / username: {data.get('login')}")
+    print(f"Name: {data.get('name')}")
+    print(f"Public repositories: {data.get('public_repos')}")
+    print(f"Profile URL: {data.get('html_url')}")
+    print()
 
 
 # === Async sections ===
-GITHUB_USER_URL = "https://api.github.com/users/{}"
+GITHUB_USER_URL = resolve_url("https://api.github.com/users/{}")
 usernames = ["octocat", "torvalds", "mojombo", "defunkt", "pjhyett"]
 
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
@@ -55,7 +61,7 @@ async def fetch_many_users(usernames: List[str]) -> List[Dict[str, Any]]:
 
 
 # === Weather + Users Concurrent Fetch ===
-WEATHER_API = "https://api.open-meteo.com/v1/forecast?latitude=0.3&longitude=32.6&current_weather=true"
+WEATHER_API = resolve_url("https://api.open-meteo.com/v1/forecast?latitude=0.3&longitude=32.6&current_weather=true")
 
 async def fetch_weather(session: aiohttp.ClientSession) -> Dict[str, Any]:
     async with session.get(WEATHER_API, timeout=10) as r:
@@ -119,28 +125,84 @@ async def fetch_many_with_retry(usernames, logfile="async_results.log"):
         return results
 
 
+# === Incremental profile store ===
+PROFILE_DB = "github_profiles.db"
+REFRESH_LOG = "profile_refresh.log"
+STALE_AFTER = 24 * 60 * 60  # seconds before a stored profile is re-fetched
+
+async def refresh_profiles(store: ProfileStore, usernames: List[str], max_age: float = STALE_AFTER,
+                           logfile: str = REFRESH_LOG) -> Dict[str, Optional[Exception]]:
+    # Re-fetch only the profiles that are missing or older than max_age. Returns each re-fetched
+    # login mapped to its error, or None if it was fetched and stored; fresh logins are left out.
+    # Fetches go through fetch_many_with_retry, which appends each batch to `logfile`.
+    stale = store.stale_logins(usernames, max_age)
+    if not stale:
+        return {}
+    results = await fetch_many_with_retry(stale, logfile=logfile)
+    store.upsert_retry_results(stale, results)
+    return {login: (err if err is not None or res_json else Exception("empty response"))
+            for login, (res_json, err) in zip(stale, results)}
+
+async def fetch_weather_only() -> Dict[str, Any]:
+    async with aiohttp.ClientSession() as session:
+        try:
+            return await fetch_weather(session)
+        except Exception as e:
+            return {"error": str(e)}
+
+
 # === Run everything inside async main ===
-async def main():
-    print("=== Part B: Async concurrent GitHub fetch ===")
-    users = await fetch_many_users(usernames)
-    users_sorted = sorted(users, key=lambda u: u.get("public_repos", -1), reverse=True)
-    for u in users_sorted:
-        if u.get("error"):
-            print(f"{u.get('login')}: ERROR -> {u.get('error')}")
+async def main(max_age: float = STALE_AFTER, sweep_only: bool = False, users: Optional[List[str]] = None):
+    # `users` defaults to the coursework `usernames`; sweep_only skips Part A, the weather and Part D
+    users = usernames if users is None else users
+    if not sweep_only:
+        part_a()
+
+    with ProfileStore(PROFILE_DB) as store:
+        # Part B/C are served from the local store: only missing or stale
+        # profiles touch the network, refreshed concurrently with the weather.
+        print("=== Part B: Async concurrent GitHub fetch (incremental, via local store) ===")
+        if sweep_only:
+            refreshed, weather = await refresh_profiles(store, users, max_age), None
         else:
-            print(f"{u.get('login')} | name: {u.get('name')} | public_repos: {u.get('public_repos')} | url: {u.get('html_url')}")
-    print()
-
-    print("=== Part C: Concurrent GitHub + Weather ===")
-    users_c, weather = await fetch_users_and_weather(usernames)
-    valid_users = [u for u in users_c if not u.get("error")]
-    top_user = max(valid_users, key=lambda u: u.get("public_repos", -1)) if valid_users else None
-    print("Top GitHub user (by public_repos):")
-    if top_user:
-        print(f"  {top_user.get('login')} ({top_user.get('name')}) - public_repos: {top_user.get('public_repos')}")
-        print(f"  Profile: {top_user.get('html_url')}")
-    else:
-        print("  No valid GitHub user data.")
+            refreshed, weather = await asyncio.gather(refresh_profiles(store, users, max_age), fetch_weather_only())
+        fetched = [login for login, err in refreshed.items() if err is None]
+        failed = [login for login, err in refreshed.items() if err is not None]
+        print(f"Re-fetched {len(fetched)} missing/stale profile(s) of {len(users)}: {', '.join(fetched) or 'none'}")
+        if failed:
+            print(f"Failed to re-fetch {len(failed)}: {', '.join(failed)} (see '{REFRESH_LOG}')")
+        print(f"{len(users) - len(refreshed)} profile(s) served from '{PROFILE_DB}' (fetched within the last {max_age:.0f}s).")
+
+        profiles = []
+        now = time.time()
+        for login in users:
+            profile = store.get(login)
+            if profile is None:
+                profile = {"login": login, "error": f"fetch failed: {refreshed.get(login)}", "public_repos": -1}
+            elif refreshed.get(login) is not None:
+                # The refresh failed but an older copy is stored: show it, marked stale
+                profile["stale"] = f"refresh failed, stored copy is {(now - profile['fetched_at']) / 3600:.1f}h old"
+            profiles.append(profile)
+        profiles_sorted = sorted(profiles, key=lambda u: u.get("public_repos", -1), reverse=True)
+        for u in profiles_sorted:
+            if u.get("error"):
+                print(f"{u.get('login')}: ERROR -> {u.get('error')}")
+            else:
+                stale = f" | STALE: {u['stale']}" if u.get("stale") else ""
+                print(f"{u.get('login')} | name: {u.get('name')} | public_repos: {u.get('public_repos')} | url: {u.get('html_url')}{stale}")
+        print()
+
+        print("=== Part C: Top GitHub users ===" if sweep_only else "=== Part C: Concurrent GitHub + Weather ===")
+        print(f"Top GitHub users of these {len(users)} (by public_repos, indexed query on the local store):")
+        top_users = store.top_by_public_repos(3, logins=users)
+        for u in top_users:
+            print(f"  {u['login']} ({u['name']}) - public_repos: {u['public_repos']}")
+            print(f"  Profile: {u['html_url']}")
+        if not top_users:
+            print("  No valid GitHub user data.")
+
+    if sweep_only:
+        return
 
     print("\nWeather (current):")
     if weather.get("error"):
@@ -156,11 +218,37 @@ async def main():
             print("  No current_weather in response.")
     print()
 
-    print("=== Part D: Async retry + async logging ===")
-    await fetch_many_with_retry(usernames, logfile="async_results.log")
+    # Coursework demo: deliberately re-fetches every user (bypassing the store)
+    # to show retries with backoff and async logging.
+    print("=== Part D: Async retry + async logging (coursework demo, always fetches) ===")
+    await fetch_many_with_retry(users, logfile="async_results.log")
     print("Completed. Logs appended to 'async_results.log'.")
 
 
 # 🚀 Run the main async function
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Question 6: async API calls with a local profile store")
+    parser.add_argument("--max-age", type=float, default=STALE_AFTER,
+                        help=f"seconds before a stored profile is re-fetched (default {STALE_AFTER})")
+    parser.add_argument("--sweep-only", action="store_true",
+                        help="only run the incremental refresh (skip Part A, the weather and Part D)")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--users", help="comma-separated GitHub logins (default: the coursework users)")
+    source.add_argument("--users-file", help="file with one GitHub login per line")
+    args = parser.parse_args()
+
+    users = None
+    if args.users is not None:
+        users = [u.strip() for u in args.users.split(",") if u.strip()]
+    elif args.users_file is not None:
+        with open(args.users_file) as f:
+            users = [line.strip() for line in f if line.strip()]
+    if users is not None:
+        # Logins are case-insensitive; keep the first spelling of each
+        unique = {}
+        for u in users:
+            unique.setdefault(u.lower(), u)
+        users = list(unique.values())
+        if not users:
+            parser.error("no GitHub logins given")
+    asyncio.run(main(args.max_age, args.sweep_only, users))
@@ -0,0 +1,372 @@
+# Local stand-in for the datasets and APIs used by question5.py and question6.py.
+#
+# Serves deterministic fixture payloads under the same paths as the live URLs:
+#   /datasets/population/master/data/population.csv          (population CSV)
+#   /owid/covid-19-data/master/public/data/latest/owid-covid-latest.csv
+#   /core/global-temp/r/annual.csv                           (temperature CSV)
+#   /users/<login>                                           (GitHub user JSON)
+#   /v1/forecast                                             (Open-Meteo JSON)
+#
+# Each route can be given latency, a bandwidth cap, random 5xx errors and a
+# rate limit (with GitHub-style X-RateLimit-* headers), so concurrency and
+# retry behaviour can be benchmarked offline and reproducibly.
+#
+# Usage:
+#   python standin_server.py --port 8765 --latency 0.2 --bandwidth 500000
+#   export STANDIN_BASE_URL=http://127.0.0.1:8765
+#   python question5.py        # now downloads from the stand-in
+import argparse
+import json
+import os
+import random
+import re
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+# Set this to the stand-in's address to point question5/question6 at it
+BASE_URL_ENV = "STANDIN_BASE_URL"
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+
+def resolve_url(url):
+    """
+    Return `url` unchanged, or rewritten onto the stand-in (same path and
+    query) when STANDIN_BASE_URL is set.
+    """
+    base = os.getenv(BASE_URL_ENV)
+    if not base:
+        return url
+    parts = urlsplit(url)
+    rewritten = base.rstrip("/") + parts.path
+    if parts.query:
+        rewritten += "?" + parts.query
+    return rewritten
+
+
+# === Fixtures ===
+# Generated from a fixed seed so every run serves identical bytes.
+
+def _code(i):
+    # 0 -> 'AAA', 1 -> 'AAB', ... (three-letter, ISO-like codes)
+    return "".join(chr(65 + (i // 26 ** k) % 26) for k in (2, 1, 0))
+
+def population_csv(countries=200, first_year=1960, last_year=2022, seed=1):
+    rng = random.Random(seed)
+    lines = ["Country Name,Country Code,Year,Value"]
+    for i in range(countries):
+        name, code = f"Country {i:03d}", _code(i)
+        value = rng.randint(50_000, 200_000_000)
+        for year in range(first_year, last_year + 1):
+            lines.append(f"{name},{code},{year},{value}")
+            value = int(value * rng.uniform(1.0, 1.03))
+    return "\n".join(lines) + "\n"
+
+
+# owid-covid-latest has dozens of columns; mirror a realistic subset
+COVID_COLUMNS = [
+    "iso_code", "continent", "location", "last_updated_date", "total_cases", "new_cases",
+    "new_cases_smoothed", "total_deaths", "new_deaths", "new_deaths_smoothed",
+    "total_cases_per_million", "new_cases_per_million", "total_deaths_per_million",
+    "new_deaths_per_million", "reproduction_rate", "icu_patients", "hosp_patients",
+    "total_tests", "new_tests", "positive_rate", "tests_per_case", "total_vaccinations",
+    "people_vaccinated", "people_fully_vaccinated", "total_boosters", "new_vaccinations",
+    "stringency_index", "population_density", "median_age", "aged_65_older",
+    "gdp_per_capita", "life_expectancy", "human_development_index", "population",
+]
+
+
+def covid_csv(locations=250, seed=2):
+    rng = random.Random(seed)
+    lines = [",".join(COVID_COLUMNS)]
+    for i in range(locations):
+        row = [_code(i), "Africa", f"Location {i:03d}", "2024-08-04"]
+        row += [f"{rng.uniform(0, 1_000_000):.3f}" for _ in COVID_COLUMNS[4:]]
+        lines.append(",".join(row))
+    return "\n".join(lines) + "\n"
+
+
+def temperature_csv(first_year=1880, last_year=2023, seed=3):
+    rng = random.Random(seed)
+    lines = ["Source,Year,Mean"]
+    for source in ("gcag", "GISTEMP"):
+        for year in range(first_year, last_year + 1):
+            lines.append(f"{source},{year},{rng.uniform(-0.5, 1.2):.4f}")
+    return "\n".join(lines) + "\n"
+
+
+def github_user(login):
+    # Stable per-login values so results can be compared across runs
+    seed = zlib.crc32(login.encode())
+    return {
+        "login": login,
+        "id": seed % 10_000_000,
+        "name": login.capitalize(),
+        "public_repos": seed % 200,
+        "followers": seed % 5000,
+        "html_url": f"https://github.com/{login}",
+        "created_at": "2010-01-01T00:00:00Z",
+    }
+
+
+def weather(query):
+    return {
+        "latitude": 0.3,
+        "longitude": 32.6,
+        "current_weather": {
+            "temperature": 24.5,
+            "windspeed": 7.2,
+            "winddirection": 180,
+            "time": "2024-01-01T12:00",
+        },
+    }
+
+
+# (name, path regex, content type, payload factory taking the regex match and query)
+ROUTES = [
+    ("population", r"/datasets/population/master/data/population\.csv",
+     "text/csv", lambda m, q: population_csv()),
+    ("covid", r"/owid/covid-19-data/master/public/data/latest/owid-covid-latest\.csv",
+     "text/csv", lambda m, q: covid_csv()),
+    ("temperature", r"/core/global-temp/r/annual\.csv",
+     "text/csv", lambda m, q: temperature_csv()),
+    ("github_user", r"/users/(?P<login>[^/]+)",
+     "application/json", lambda m, q: github_user(m.group("login"))),
+    ("weather", r"/v1/forecast",
+     "application/json", lambda m, q: weather(q)),
+]
+
+
+# === Route behaviour ===
+
+class RouteConfig:
+    """
+    Behaviour of one route.
+
+    latency      -- seconds to wait before responding
+    bandwidth    -- response body rate cap in bytes/second (0 = unlimited)
+    error_rate   -- probability (0..1) of answering with error_status instead
+    error_status -- status code for injected errors (a 5xx)
+    rate_limit   -- requests allowed per rate_window seconds (0 = unlimited)
+    rate_status  -- status code once the limit is exhausted
+    """
+
+    FIELDS = ("latency", "bandwidth", "error_rate", "error_status",
+              "rate_limit", "rate_window", "rate_status")
+
+    def __init__(self, latency=0.0, bandwidth=0, error_rate=0.0, error_status=503,
+                 rate_limit=0, rate_window=60.0, rate_status=429):
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.rate_status = rate_status
+        self._lock = threading.Lock()
+        self._window_start = time.time()
+        self._used = 0
+
+    def updated(self, overrides):
+        # Copy of this config with some fields replaced
+        values = {f: getattr(self, f) for f in self.FIELDS}
+        for key, value in overrides.items():
+            if key not in self.FIELDS:
+                raise ValueError(f"Unknown route setting: {key}")
+            values[key] = value
+        return RouteConfig(**values)
+
+    def take_rate_token(self):
+        # Returns (allowed, remaining, reset_epoch) for one request
+        with self._lock:
+            now = time.time()
+            if now - self._window_start >= self.rate_window:
+                self._window_start, self._used = now, 0
+            reset = int(self._window_start + self.rate_window)
+            if self.rate_limit and self._used >= self.rate_limit:
+                return False, 0, reset
+            self._used += 1
+            return True, max(self.rate_limit - self._used, 0), reset
+
+
+class StandinConfig:
+    """
+    Default route behaviour plus per-route overrides, keyed by route name
+    (see ROUTES). Injected errors draw from one seeded generator so a given
+    request order always fails the same requests.
+    """
+
+    def __init__(self, default=None, routes=None, seed=0, fixtures_dir=None):
+        routes = routes or {}
+        names = [name for name, *_ in ROUTES]
+        for name in routes:
+            if name not in names:
+                raise ValueError(f"Unknown route: {name}")
+        self.default = default or RouteConfig()
+        self.routes = {name: self.default.updated(routes.get(name, {})) for name in names}
+        self.fixtures_dir = fixtures_dir
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+
+    @classmethod
+    def from_file(cls, path, default=None, **kwargs):
+        # JSON file: {"default": {...}, "routes": {"covid": {"latency": 1.5}, ...}}
+        with open(path) as f:
+            raw = json.load(f)
+        default = (default or RouteConfig()).updated(raw.get("default", {}))
+        return cls(default=default, routes=raw.get("routes", {}), **kwargs)
+
+    def should_fail(self, route_config):
+        if not route_config.error_rate:
+            return False
+        with self._rng_lock:
+            return self._rng.random() < route_config.error_rate
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    server_version = "StandinServer/1.0"
+    protocol_version = "HTTP/1.1"
+    chunk_size = 16 * 1024
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        for name, pattern, content_type, factory in ROUTES:
+            match = re.fullmatch(pattern, parts.path)
+            if match:
+                break
+        else:
+            return self.send_payload(404, json.dumps({"message": "Not Found"}).encode(), "application/json")
+
+        config = self.server.config
+        route = config.routes[name]
+
+        allowed, remaining, reset = route.take_rate_token()
+        headers = {}
+        if route.rate_limit:
+            headers = {
+                "X-RateLimit-Limit": str(route.rate_limit),
+                "X-RateLimit-Remaining": str(remaining),
+                "X-RateLimit-Reset": str(reset),
+            }
+        if not allowed:
+            headers["Retry-After"] = str(max(reset - int(time.time()), 0))
+            body = json.dumps({"message": "API rate limit exceeded"}).encode()
+            return self.send_payload(route.rate_status, body, "application/json", headers)
+
+        if route.latency:
+            time.sleep(route.latency)
+
+        if config.should_fail(route):
+            body = json.dumps({"message": "Injected server error"}).encode()
+            return self.send_payload(route.error_status, body, "application/json", headers)
+
+        body = self.server.payload(name, factory, match, parts.query, parts.path)
+        self.send_payload(200, body, content_type, headers, route.bandwidth)
+
+    def send_payload(self, status, body, content_type, headers=None, bandwidth=0):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if not bandwidth:
+            self.wfile.write(body)
+            return
+        # Throttle: write in chunks, sleeping so the average rate stays at bandwidth
+        start = time.perf_counter()
+        for offset in range(0, len(body), self.chunk_size):
+            chunk = body[offset:offset + self.chunk_size]
+            self.wfile.write(chunk)
+            due = (offset + len(chunk)) / bandwidth
+            elapsed = time.perf_counter() - start
+            if due > elapsed:
+                time.sleep(due - elapsed)
+
+
+class StandinServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, config=None, quiet=False):
+        super().__init__(address, StandinHandler)
+        self.config = config or StandinConfig()
+        self.quiet = quiet
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def payload(self, name, factory, match, query, path):
+        # CSV fixtures are built once and cached; JSON payloads depend on the request
+        if self.config.fixtures_dir:
+            fixture = os.path.join(self.config.fixtures_dir, path.lstrip("/"))
+            if os.path.isfile(fixture):
+                with open(fixture, "rb") as f:
+                    return f.read()
+        key = name if name in ("population", "covid", "temperature") else None
+        if key is not None:
+            with self._cache_lock:
+                if key not in self._cache:
+                    self._cache[key] = factory(match, query).encode()
+                return self._cache[key]
+        return json.dumps(factory(match, query)).encode()
+
+
+def start_server(host=DEFAULT_HOST, port=0, config=None, quiet=True):
+    """
+    Start a stand-in server on a background thread and return it.
+    Port 0 picks a free port; read it back from server.base_url.
+    Call server.shutdown() when done.
+    """
+    server = StandinServer((host, port), config, quiet)
+    threading.Thread(target=server.serve_forever, name="StandinServer", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the question5/question6 datasets and APIs")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds before each response")
+    parser.add_argument("--bandwidth", type=int, default=0, help="bytes/second per response (0 = unlimited)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="probability of an injected 5xx")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--rate-limit", type=int, default=0, help="requests per window per route (0 = unlimited)")
+    parser.add_argument("--rate-window", type=float, default=60.0)
+    parser.add_argument("--seed", type=int, default=0, help="seed for error injection")
+    parser.add_argument("--config", help="JSON file with default and per-route settings")
+    parser.add_argument("--fixtures", help="directory of real payloads laid out by URL path")
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args()
+
+    default = RouteConfig(args.latency, args.bandwidth, args.error_rate, args.error_status,
+                          args.rate_limit, args.rate_window)
+    if args.config:
+        config = StandinConfig.from_file(args.config, default, seed=args.seed, fixtures_dir=args.fixtures)
+    else:
+        config = StandinConfig(default, seed=args.seed, fixtures_dir=args.fixtures)
+
+    server = StandinServer((args.host, args.port), config, args.quiet)
+    print(f"Stand-in server listening on {server.base_url}")
+    print(f"Point the scripts at it with: export {BASE_URL_ENV}={server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopping stand-in server")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()